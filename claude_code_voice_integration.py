@@ -66,7 +66,15 @@ def main():
             except Exception as e:
                 print(f"❌ Could not copy to clipboard: {e}")
         
+        # While streaming, keep the clipboard up to date with confirmed words
+        def handle_partial_text(text: str):
+            try:
+                pyperclip.copy(text)
+            except Exception:
+                pass
+        
         voice_input.on_text = handle_voice_text
+        voice_input.on_partial = handle_partial_text
         voice_input.start(voice_input.on_text)
         voice_enabled = True
         
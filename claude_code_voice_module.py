@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Claude Code Voice-to-Text Module
-Adds push-to-talk voice input capabilities using Whisper
+Adds push-to-talk voice input capabilities using Whisper (faster-whisper)
 """
 
 import os
@@ -15,19 +15,20 @@ os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
 
 import time
 import json
-import wave
 import queue
+import functools
+import select
 import threading
-import tempfile
 from pathlib import Path
 from typing import Optional, Callable
 from dataclasses import dataclass
 from enum import Enum
 
-import pyaudio
+import sounddevice as sd
 import numpy as np
 import pynput.keyboard
-import whisper
+import ctranslate2
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 # macOS focus detection
 try:
@@ -43,9 +44,43 @@ try:
     HAS_APPKIT = True
 except ImportError:
     HAS_APPKIT = False
+
+# macOS native hotkey (event tap)
+try:
+    from Quartz import (
+        CGEventTapCreate,
+        CGEventTapEnable,
+        CGEventMaskBit,
+        CGEventGetFlags,
+        CGEventGetIntegerValueField,
+        kCGSessionEventTap,
+        kCGHeadInsertEventTap,
+        kCGEventTapOptionListenOnly,
+        kCGEventFlagsChanged,
+        kCGEventTapDisabledByTimeout,
+        kCGKeyboardEventKeycode,
+    )
+    from CoreFoundation import (
+        CFMachPortCreateRunLoopSource,
+        CFRunLoopGetCurrent,
+        CFRunLoopAddSource,
+        CFRunLoopRun,
+        CFRunLoopStop,
+        kCFRunLoopCommonModes,
+    )
+    HAS_EVENT_TAP = True
+except ImportError:
+    HAS_EVENT_TAP = False
+
+# Linux native hotkey (input devices)
+try:
+    import evdev
+    from evdev import ecodes
+    HAS_EVDEV = True
+except ImportError:
+    HAS_EVDEV = False
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm
 from rich.text import Text
 
@@ -55,7 +90,8 @@ from rich.text import Text
 class VoiceConfig:
     """Configuration for voice input"""
     push_to_talk_key: str = "right_shift"  # Default PTT key
-    whisper_model: str = "base"  # tiny, base, small, medium, large
+    whisper_model: str = "distil-small.en"  # distil-small.en (English), tiny, base, small, medium, large
+    precision: str = "auto"  # auto, fp32, fp16, bf16, int8
     language: str = "en"  # English by default
     sample_rate: int = 16000
     channels: int = 1
@@ -63,8 +99,18 @@ class VoiceConfig:
     silence_threshold: float = 100  # RMS threshold for silence detection
     silence_duration: float = 1.5  # Seconds of silence to stop recording
     max_recording_time: float = 30.0  # Maximum recording duration
+    min_recording_time: float = 0.4  # Shorter recordings are not transcribed
+    beam_size: int = 1  # 1 = greedy decoding, fastest for short utterances
+    without_timestamps: bool = True  # Skip timestamp tokens (not needed for PTT)
+    batch_size: int = 8  # Speech chunks decoded together for recordings over 30s
     auto_submit: bool = False  # Auto-submit after transcription
     show_audio_levels: bool = True  # Show audio level indicator
+    streaming: bool = True  # Transcribe while recording, confirming words as they settle
+
+    @property
+    def silence_threshold_sq(self) -> float:
+        """Squared silence threshold, compared against sums of squares to skip a sqrt"""
+        return self.silence_threshold ** 2
     
     @classmethod
     def from_file(cls, config_path: Path) -> "VoiceConfig":
@@ -90,23 +136,34 @@ class AudioRecorder:
     
     def __init__(self, config: VoiceConfig):
         self.config = config
-        self.audio = pyaudio.PyAudio()
         self.recording = False
-        self.frames = []
-        self.audio_queue = queue.Queue()
+        self.audio_queue = queue.SimpleQueue()
         self.console = Console()
+        # Scratch buffer for the level calculation, reused for every chunk.
+        # int64 because a chunk's sum of squares overflows int32.
+        self._level_scratch = np.empty(config.chunk_size * config.channels, dtype=np.int64)
+        # Preallocated clip buffer (16-bit samples) with a few chunks of slack
+        # for audio that arrives while the stream is being stopped
+        bytes_per_chunk = config.chunk_size * config.channels * 2
+        max_bytes = int(config.max_recording_time * config.sample_rate) * config.channels * 2
+        self._buf = bytearray(max_bytes + 4 * bytes_per_chunk)
+        self._buf_len = 0
+        self.peak_level_sq = 0
+        self._last_paint = 0.0
         
-    def get_audio_level(self, data: bytes) -> float:
-        """Calculate RMS audio level"""
+    def get_audio_level_sq(self, data: bytes) -> int:
+        """Calculate the sum of squared samples (RMS before mean and sqrt)"""
         try:
             audio_data = np.frombuffer(data, dtype=np.int16)
-            if len(audio_data) == 0:
-                return 0.0
-            rms = np.sqrt(np.mean(audio_data.astype(np.float64)**2))
-            return float(rms) if not np.isnan(rms) and not np.isinf(rms) else 0.0
+            n = len(audio_data)
+            if n > len(self._level_scratch):
+                self._level_scratch = np.empty(n, dtype=np.int64)
+            widened = self._level_scratch[:n]
+            np.copyto(widened, audio_data)
+            return int(np.dot(widened, widened))
         except Exception:
-            return 0.0
-    
+            return 0
+
     def draw_audio_level(self, level: float, max_level: float = 5000) -> str:
         """Create visual audio level indicator"""
         normalized = min(level / max_level, 1.0)
@@ -122,18 +179,34 @@ class AudioRecorder:
             
         bar = f"[{color}]{'█' * filled}{'░' * (bar_length - filled)}[/{color}]"
         return bar
+
+    def _callback(self, indata, frames, time_info, status):
+        """PortAudio callback: copy the chunk into the clip buffer, tell the loop where it is"""
+        start = self._buf_len
+        end = start + len(indata)
+        if end > len(self._buf):
+            self.audio_queue.put(None)  # Buffer full
+            raise sd.CallbackStop
+        self._buf[start:end] = indata
+        self._buf_len = end
+        self.audio_queue.put((start, end))
     
-    def record_audio(self) -> Optional[bytes]:
-        """Record audio while PTT key is held"""
-        stream = self.audio.open(
-            format=pyaudio.paInt16,
+    def record_audio(self, on_chunk: Optional[Callable[[bytes], None]] = None) -> Optional[memoryview]:
+        """Record audio while PTT key is held, passing each chunk to on_chunk if given"""
+        # Fresh queue so nothing from a previous recording leaks in
+        self.audio_queue = queue.SimpleQueue()
+        self._buf_len = 0
+        stream = sd.RawInputStream(
+            samplerate=self.config.sample_rate,
+            blocksize=self.config.chunk_size,
+            dtype='int16',
             channels=self.config.channels,
-            rate=self.config.sample_rate,
-            input=True,
-            frames_per_buffer=self.config.chunk_size
+            callback=self._callback
         )
+        stream.start()
         
-        self.frames = []
+        num_chunks = 0
+        self.peak_level_sq = 0  # Loudest chunk's sum of squares
         self.recording = True
         silence_start = None
         start_time = time.time()
@@ -150,22 +223,42 @@ class AudioRecorder:
                     self.console.print("[red]Max recording time reached[/red]")
                     break
                 
-                # Read audio chunk
-                data = stream.read(self.config.chunk_size, exception_on_overflow=False)
-                self.frames.append(data)
+                # Wait for the next captured chunk, waking up regularly to
+                # notice key release and the recording time limit
+                try:
+                    chunk = self.audio_queue.get(timeout=0.1)
+                except queue.Empty:
+                    if not getattr(self, 'should_continue_recording', True):
+                        break
+                    continue
+                if chunk is None:
+                    self.console.print("[red]Max recording time reached[/red]")
+                    break
+                # Zero-copy view of the chunk the callback just stored
+                data = memoryview(self._buf)[chunk[0]:chunk[1]]
+                num_chunks += 1
+                if on_chunk:
+                    on_chunk(data)
                 
-                # Calculate audio level (always needed for silence detection)
-                level = self.get_audio_level(data)
+                # Sum of squares is all silence detection needs
+                num_samples = len(data) // 2
+                level_sq = self.get_audio_level_sq(data)
+                self.peak_level_sq = max(self.peak_level_sq, level_sq)
                 
-                # Only show audio levels after sufficient data
-                if len(self.frames) >= min_data_threshold and self.config.show_audio_levels:
+                # Only show audio levels after sufficient data, repainting at most 10x/s
+                now = time.monotonic()
+                if (self.config.show_audio_levels and num_chunks >= min_data_threshold
+                        and now - self._last_paint > 0.1):
+                    level = float(np.sqrt(level_sq / num_samples)) if num_samples else 0.0
                     level_bar = self.draw_audio_level(level)
                     # \033[A = move up, \033[2K = clear line, \r = start of line
-                    sys.stdout.write(f"\033[A\033[2K\r  Level: {level_bar} {int(level):5d}\n")
-                    sys.stdout.flush()
+                    payload = f"\033[A\033[2K\r  Level: {level_bar} {int(level):5d}\n"
+                    # One unbuffered write per repaint (stdout was flushed above)
+                    os.write(1, payload.encode())
+                    self._last_paint = now
                 
                 # Detect silence for auto-stop
-                if level < self.config.silence_threshold:
+                if level_sq < self.config.silence_threshold_sq * num_samples:
                     if silence_start is None:
                         silence_start = time.time()
                     elif time.time() - silence_start > self.config.silence_duration:
@@ -179,16 +272,74 @@ class AudioRecorder:
                     break
                     
         finally:
-            stream.stop_stream()
+            stream.stop()
             stream.close()
+            # Chunks stored after the last one the loop looked at are already
+            # in the buffer; only on_chunk still needs to see them
+            while True:
+                try:
+                    chunk = self.audio_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if chunk is not None and on_chunk:
+                    on_chunk(memoryview(self._buf)[chunk[0]:chunk[1]])
             if self.config.show_audio_levels:
                 sys.stdout.write("\033[A\033[2K\r")  # Move up and clear the level bar line
                 sys.stdout.flush()
             
-        if self.frames:
-            return b''.join(self.frames)
+        if self._buf_len:
+            # Zero-copy view; valid until the next recording starts
+            return memoryview(self._buf)[:self._buf_len]
         return None
 
+    def is_silent(self, audio_data: memoryview) -> bool:
+        """Check if the last recording is too short or never rose above the silence threshold"""
+        bytes_per_second = self.config.sample_rate * self.config.channels * 2
+        if len(audio_data) / bytes_per_second < self.config.min_recording_time:
+            return True
+        chunk_samples = self.config.chunk_size * self.config.channels
+        return self.peak_level_sq < self.config.silence_threshold_sq * chunk_samples
+
+
+def to_float32(audio_data: bytes) -> np.ndarray:
+    """Convert recorded 16-bit PCM to the float32 samples Whisper expects"""
+    # Audio is already 16 kHz mono int16, so no decoding or resampling is needed.
+    # Scaling with an explicit output dtype converts in a single allocation.
+    samples = np.frombuffer(audio_data, dtype=np.int16)
+    return np.multiply(samples, 1.0 / 32768.0, dtype=np.float32)
+
+
+def _physical_cores() -> int:
+    """Best-effort physical core count; the logical count when SMT is off or unknown"""
+    logical = os.cpu_count() or 1
+    try:
+        if sys.platform == "darwin":
+            import subprocess
+            result = subprocess.run(['sysctl', '-n', 'hw.physicalcpu'], capture_output=True, text=True)
+            return max(1, int(result.stdout.strip()))
+        # Linux: 2-way SMT (hyperthreading) enabled
+        with open('/sys/devices/system/cpu/smt/active') as f:
+            if f.read().strip() == '1':
+                return max(1, logical // 2)
+    except (OSError, ValueError):
+        pass
+    return logical
+
+
+@functools.lru_cache(maxsize=4)
+def _load_cached(model_name: str, device: str, compute_type: str) -> WhisperModel:
+    """Load a Whisper model once per (model, device, compute type)"""
+    # One thread per physical core: SMT siblings share the matmul units and
+    # mostly add contention, but CPUs without SMT (e.g. Apple Silicon) use every core
+    cpu_threads = _physical_cores()
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=1
+    )
+
 
 class WhisperTranscriber:
     """Handles transcription using Whisper"""
@@ -197,48 +348,108 @@ class WhisperTranscriber:
         self.config = config
         self.console = Console()
         self.model = None
+        self.batched_model = None
         self._load_local_model()
             
     def _load_local_model(self):
         """Load local Whisper model"""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console
-        ) as progress:
-            task = progress.add_task(
-                f"Loading Whisper model ({self.config.whisper_model})...", 
-                total=None
+        self.console.print(f"[cyan]Loading Whisper model ({self.config.whisper_model})...[/cyan]")
+        self.device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        self.model = _load_cached(self.config.whisper_model, self.device, self._compute_type())
+        self.batched_model = BatchedInferencePipeline(model=self.model)
+        self._warm_up()
+        self.console.print("[green]✓ Whisper model ready[/green]")
+
+    def _warm_up(self):
+        """Run a dummy inference so the first real utterance isn't cold"""
+        silence = np.zeros(self.config.sample_rate, dtype=np.float32)
+        # Without VAD the encoder and decoder actually run on the silence;
+        # with VAD the Silero model gets loaded as well
+        passes = [self.decode_options(vad_filter=False), self.decode_options()]
+        if self.config.streaming:
+            # Streaming passes decode timestamps and align words
+            passes.append(self.decode_options(
+                vad_filter=False,
+                without_timestamps=False,
+                word_timestamps=True
+            ))
+        for options in passes:
+            segments, _ = self.model.transcribe(silence, **options)
+            for _ in segments:
+                pass
+
+    def _compute_type(self) -> str:
+        """Map the configured precision to a CTranslate2 compute type"""
+        precision = self.config.precision.lower()
+        if precision not in ("auto", "fp32", "fp16", "bf16", "int8"):
+            raise ValueError(
+                f"Unknown precision '{self.config.precision}' "
+                f"(expected auto, fp32, fp16, bf16 or int8)"
+            )
+        if precision == "auto":
+            # Half precision on GPU tensor cores, int8 kernels on CPU
+            precision = "fp16" if self.device == "cuda" else "int8"
+
+        if precision == "int8":
+            # Keep activations in fp16 on GPU, int8 weights either way
+            compute_type = "int8_float16" if self.device == "cuda" else "int8"
+        else:
+            compute_type = {"fp32": "float32", "fp16": "float16", "bf16": "bfloat16"}[precision]
+
+        # CTranslate2 refuses types the device can't run efficiently
+        # (fp16/bf16 on CPU, bf16 on pre-Ampere GPUs)
+        if compute_type not in ctranslate2.get_supported_compute_types(self.device):
+            fallback = "float16" if self.device == "cuda" else "int8"
+            self.console.print(
+                f"[yellow]{self.config.precision} is not supported on {self.device}, "
+                f"using {fallback}[/yellow]"
             )
-            self.model = whisper.load_model(self.config.whisper_model)
-            progress.update(task, completed=True)
+            compute_type = fallback
+        return compute_type
     
+    def decode_options(self, **overrides) -> dict:
+        """Keyword arguments for model.transcribe, with optional overrides"""
+        # Short interactive utterances: no temperature fallback, no prompt
+        # carried between windows, and no timestamp tokens to decode
+        options = dict(
+            language=None if self.config.language == "auto" else self.config.language,
+            beam_size=self.config.beam_size,
+            without_timestamps=self.config.without_timestamps,
+            temperature=0,
+            condition_on_previous_text=False,
+            no_speech_threshold=0.6,
+            vad_filter=True
+        )
+        options.update(overrides)
+        return options
+
     def transcribe_local(self, audio_data: bytes) -> Optional[str]:
         """Transcribe using local Whisper model"""
-        # Save audio to temporary file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-            wf = wave.open(tmp_file.name, 'wb')
-            wf.setnchannels(self.config.channels)
-            wf.setsampwidth(2)  # 16-bit audio
-            wf.setframerate(self.config.sample_rate)
-            wf.writeframes(audio_data)
-            wf.close()
-            
-            # Transcribe
-            result = self.model.transcribe(
-                tmp_file.name,
-                language=self.config.language,
-                fp16=False
+        audio_array = to_float32(audio_data)
+        options = self.decode_options()
+
+        # Whisper works in 30 s windows. Longer recordings are split on speech
+        # boundaries and the chunks are run through the model as one batch.
+        if len(audio_array) > 30 * self.config.sample_rate and self.config.batch_size > 1:
+            segments, _ = self.batched_model.transcribe(
+                audio_array,
+                batch_size=self.config.batch_size,
+                **options
             )
-            
-            # Clean up
-            os.unlink(tmp_file.name)
-            
-            return result["text"].strip()
+        else:
+            segments, _ = self.model.transcribe(audio_array, **options)
+
+        # Segments are yielded lazily; joining them runs the decode
+        return "".join(segment.text for segment in segments).strip()
     
     
-    def transcribe(self, audio_data: bytes) -> Optional[str]:
-        """Transcribe audio data using local Whisper model"""
+    def transcribe(self, audio_data: bytes,
+                   stream: Optional["StreamingTranscription"] = None) -> Optional[str]:
+        """Transcribe audio data using local Whisper model
+
+        When a streaming transcription ran during recording, only its
+        unconfirmed tail is left to transcribe.
+        """
         if not audio_data:
             return None
 
@@ -246,11 +457,309 @@ class WhisperTranscriber:
         sys.stdout.write("\033[A\033[2K\r⏳ Transcribing...\n")
         sys.stdout.flush()
 
+        if stream is not None:
+            return stream.finish()
+
         text = self.transcribe_local(audio_data)
 
         return text
 
 
+class StreamingTranscription:
+    """Transcribes audio while it is recorded, confirming words with LocalAgreement-2
+
+    Every pass re-transcribes the unconfirmed tail of the recording. Words
+    that two consecutive passes agree on are confirmed, reported through
+    on_confirmed, and cut from the audio so later passes stay short.
+    """
+
+    MIN_WINDOW = 2.0  # Seconds of audio before the first pass
+    STEP = 0.5  # Seconds of new audio between passes
+    MAX_WINDOW = 28.0  # Confirm everything rather than grow past one Whisper window
+
+    def __init__(self, transcriber: WhisperTranscriber,
+                 on_confirmed: Optional[Callable[[str], None]] = None):
+        self.transcriber = transcriber
+        self.config = transcriber.config
+        self.on_confirmed = on_confirmed
+        self.chunks = queue.SimpleQueue()
+        self.audio = np.zeros(0, dtype=np.float32)  # Unconfirmed tail
+        self.offset = 0.0  # Recording time (s) of self.audio[0]
+        self.confirmed = []  # Confirmed word texts
+        self.previous = []  # Last pass's unconfirmed words as (start, end, text)
+        self._new_samples = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def feed(self, data: bytes):
+        """Queue a chunk of recorded int16 audio"""
+        # Convert now: the recorder's buffer is reused by the next recording
+        self.chunks.put(to_float32(data))
+
+    def text(self) -> str:
+        """Confirmed text so far"""
+        return "".join(self.confirmed).strip()
+
+    def _drain(self):
+        pending = []
+        while True:
+            try:
+                pending.append(self.chunks.get_nowait())
+            except queue.Empty:
+                break
+        if pending:
+            self.audio = np.concatenate([self.audio] + pending)
+            self._new_samples += sum(len(chunk) for chunk in pending)
+
+    def _prompt(self) -> Optional[str]:
+        # Confirmed text stands in for the audio that was cut off
+        return self.text()[-200:] or None
+
+    def _run(self):
+        sample_rate = self.config.sample_rate
+        while not self._stopped.is_set():
+            self._drain()
+            if (len(self.audio) < self.MIN_WINDOW * sample_rate
+                    or self._new_samples < self.STEP * sample_rate):
+                self._stopped.wait(0.05)
+                continue
+            self._new_samples = 0
+            try:
+                self._process()
+            except Exception:
+                # Leave everything unconfirmed; finish() transcribes it
+                return
+
+    def _process(self):
+        segments, _ = self.transcriber.model.transcribe(
+            self.audio,
+            **self.transcriber.decode_options(
+                without_timestamps=False,
+                word_timestamps=True,
+                condition_on_previous_text=True,
+                initial_prompt=self._prompt()
+            )
+        )
+        hypothesis = [
+            (self.offset + word.start, self.offset + word.end, word.word)
+            for segment in segments
+            for word in segment.words
+        ]
+
+        # LocalAgreement-2: confirm the prefix two consecutive passes agree on
+        agreed = 0
+        for (_, _, previous), (_, _, current) in zip(self.previous, hypothesis):
+            if previous.strip().lower() != current.strip().lower():
+                break
+            agreed += 1
+        if len(self.audio) > self.MAX_WINDOW * self.config.sample_rate:
+            agreed = len(hypothesis)
+
+        self.previous = hypothesis[agreed:]
+        if not agreed:
+            return
+
+        self.confirmed.extend(word for _, _, word in hypothesis[:agreed])
+        cut = hypothesis[agreed - 1][1]
+        self.audio = self.audio[int((cut - self.offset) * self.config.sample_rate):]
+        self.offset = cut
+        if self.on_confirmed:
+            self.on_confirmed(self.text())
+
+    def cancel(self):
+        """Stop streaming and discard the result"""
+        self._stopped.set()
+        self._thread.join()
+
+    def finish(self) -> str:
+        """Stop streaming and transcribe whatever is still unconfirmed"""
+        self.cancel()
+        self._drain()
+        tail = ""
+        if len(self.audio):
+            segments, _ = self.transcriber.model.transcribe(
+                self.audio,
+                **self.transcriber.decode_options(initial_prompt=self._prompt())
+            )
+            tail = "".join(segment.text for segment in segments)
+        return ("".join(self.confirmed) + tail).strip()
+
+
+def _normalize_hotkey(hotkey: str) -> str:
+    """Convert a configured key name to pynput's naming ("right_shift" -> "shift_r")"""
+    hotkey = hotkey.lower()
+    hotkey_parts = hotkey.replace('_', ' ').split()
+    if len(hotkey_parts) == 2 and hotkey_parts[0] in ('right', 'left'):
+        suffix = 'r' if hotkey_parts[0] == 'right' else 'l'
+        return f"{hotkey_parts[1]}_{suffix}"
+    return hotkey
+
+
+class QuartzHotkeyListener:
+    """Watches a single modifier key through a listen-only macOS event tap"""
+
+    # pynput key name -> (virtual keycode, device-dependent modifier flag)
+    KEYS = {
+        'shift': (56, 0x02), 'shift_l': (56, 0x02), 'shift_r': (60, 0x04),
+        'ctrl': (59, 0x01), 'ctrl_l': (59, 0x01), 'ctrl_r': (62, 0x2000),
+        'alt': (58, 0x20), 'alt_l': (58, 0x20), 'alt_r': (61, 0x40),
+        'cmd': (55, 0x08), 'cmd_l': (55, 0x08), 'cmd_r': (54, 0x10),
+    }
+
+    def __init__(self, keycode: int, flag: int, on_press: Callable[[], None],
+                 on_release: Callable[[], None]):
+        self.keycode = keycode
+        self.flag = flag
+        self.on_press = on_press
+        self.on_release = on_release
+        self.pressed = False
+        self._tap = None
+        self._run_loop = None
+        self._ready = threading.Event()
+
+    @classmethod
+    def create(cls, hotkey: str, on_press: Callable[[], None],
+               on_release: Callable[[], None]) -> Optional["QuartzHotkeyListener"]:
+        """Return a listener if the hotkey can be watched natively, else None"""
+        if not HAS_EVENT_TAP or hotkey not in cls.KEYS:
+            return None
+        keycode, flag = cls.KEYS[hotkey]
+        return cls(keycode, flag, on_press, on_release)
+
+    def _callback(self, proxy, event_type, event, refcon):
+        # macOS disables taps whose callback is slow; turn it back on
+        if event_type == kCGEventTapDisabledByTimeout:
+            CGEventTapEnable(self._tap, True)
+            return event
+
+        if CGEventGetIntegerValueField(event, kCGKeyboardEventKeycode) == self.keycode:
+            pressed = bool(CGEventGetFlags(event) & self.flag)
+            if pressed != self.pressed:
+                self.pressed = pressed
+                if pressed:
+                    self.on_press()
+                else:
+                    self.on_release()
+        return event
+
+    def _run(self):
+        source = CFMachPortCreateRunLoopSource(None, self._tap, 0)
+        self._run_loop = CFRunLoopGetCurrent()
+        CFRunLoopAddSource(self._run_loop, source, kCFRunLoopCommonModes)
+        CGEventTapEnable(self._tap, True)
+        self._ready.set()
+        CFRunLoopRun()
+
+    def start(self):
+        """Install the event tap and service it on a background thread"""
+        self._tap = CGEventTapCreate(
+            kCGSessionEventTap,
+            kCGHeadInsertEventTap,
+            kCGEventTapOptionListenOnly,
+            # Only modifier changes reach Python; ordinary typing never does
+            CGEventMaskBit(kCGEventFlagsChanged),
+            self._callback,
+            None
+        )
+        if self._tap is None:
+            raise RuntimeError("Could not create event tap (missing Accessibility permission?)")
+        threading.Thread(target=self._run, daemon=True).start()
+        self._ready.wait(timeout=1.0)
+
+    def stop(self):
+        """Remove the event tap"""
+        if self._tap is not None:
+            CGEventTapEnable(self._tap, False)
+        if self._run_loop is not None:
+            CFRunLoopStop(self._run_loop)
+
+
+class EvdevHotkeyListener:
+    """Watches a single key on Linux input devices via evdev"""
+
+    # pynput key name -> evdev key code name. evdev codes are physical key
+    # positions, so only layout-independent keys are listed; character keys
+    # and anything else go through pynput, which sees the active layout.
+    KEYS = {
+        'shift': 'KEY_LEFTSHIFT', 'shift_l': 'KEY_LEFTSHIFT', 'shift_r': 'KEY_RIGHTSHIFT',
+        'ctrl': 'KEY_LEFTCTRL', 'ctrl_l': 'KEY_LEFTCTRL', 'ctrl_r': 'KEY_RIGHTCTRL',
+        'alt': 'KEY_LEFTALT', 'alt_l': 'KEY_LEFTALT', 'alt_r': 'KEY_RIGHTALT',
+        'alt_gr': 'KEY_RIGHTALT',
+        'cmd': 'KEY_LEFTMETA', 'cmd_l': 'KEY_LEFTMETA', 'cmd_r': 'KEY_RIGHTMETA',
+        'caps_lock': 'KEY_CAPSLOCK', 'num_lock': 'KEY_NUMLOCK', 'scroll_lock': 'KEY_SCROLLLOCK',
+        'pause': 'KEY_PAUSE', 'print_screen': 'KEY_SYSRQ', 'insert': 'KEY_INSERT',
+        'delete': 'KEY_DELETE', 'home': 'KEY_HOME', 'end': 'KEY_END',
+        'page_up': 'KEY_PAGEUP', 'page_down': 'KEY_PAGEDOWN',
+        'up': 'KEY_UP', 'down': 'KEY_DOWN', 'left': 'KEY_LEFT', 'right': 'KEY_RIGHT',
+        **{f'f{n}': f'KEY_F{n}' for n in range(1, 21)},
+    }
+
+    def __init__(self, devices: list, code: int, on_press: Callable[[], None],
+                 on_release: Callable[[], None]):
+        self.devices = devices
+        self.code = code
+        self.on_press = on_press
+        self.on_release = on_release
+        self._stopped = threading.Event()
+
+    @classmethod
+    def create(cls, hotkey: str, on_press: Callable[[], None],
+               on_release: Callable[[], None]) -> Optional["EvdevHotkeyListener"]:
+        """Return a listener if a readable input device has the hotkey, else None"""
+        if not HAS_EVDEV or hotkey not in cls.KEYS:
+            return None
+        code = getattr(ecodes, cls.KEYS[hotkey], None)
+        if code is None:
+            return None
+
+        # list_devices() only returns devices we are allowed to read
+        devices = []
+        for path in evdev.list_devices():
+            try:
+                device = evdev.InputDevice(path)
+            except OSError:
+                continue
+            if code in device.capabilities().get(ecodes.EV_KEY, []):
+                devices.append(device)
+            else:
+                device.close()
+        if not devices:
+            return None
+        return cls(devices, code, on_press, on_release)
+
+    def _run(self):
+        # Devices are not grabbed, so the key keeps working in other apps
+        devices = {device.fd: device for device in self.devices}
+        while not self._stopped.is_set():
+            readable, _, _ = select.select(list(devices), [], [], 0.5)
+            for fd in readable:
+                try:
+                    events = list(devices[fd].read())
+                except OSError:
+                    # Device went away (e.g. keyboard unplugged)
+                    devices.pop(fd).close()
+                    continue
+                for event in events:
+                    if event.type != ecodes.EV_KEY or event.code != self.code:
+                        continue
+                    # 1 = down, 0 = up, 2 = autorepeat (ignored)
+                    if event.value == 1:
+                        self.on_press()
+                    elif event.value == 0:
+                        self.on_release()
+        for device in devices.values():
+            device.close()
+
+    def start(self):
+        """Start watching the input devices on a background thread"""
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def stop(self):
+        """Stop watching and close the input devices"""
+        self._stopped.set()
+
+
 class VoiceInput:
     """Main voice input handler for Claude Code"""
     
@@ -260,12 +769,18 @@ class VoiceInput:
             config_path = Path.home() / ".claude" / "voice_config.json"
         
         self.config = VoiceConfig.from_file(config_path)
+        # Precomputed once: _matches_hotkey runs for every key event system-wide
+        self._hotkey_variants = self._build_variants(self.config.push_to_talk_key.lower())
         self.recorder = AudioRecorder(self.config)
         self.transcriber = WhisperTranscriber(self.config)
         self.console = Console()
         self.active = False
         self.listener = None
         self.recording = False
+        # Held from key press until transcription finishes: recordings share
+        # the recorder's buffer and queue, so they must never overlap
+        self._busy = threading.Lock()
+        self.on_partial = None  # Called with confirmed text while streaming
         
     def start(self, on_text: Callable[[str], None]):
         """Start voice input system"""
@@ -281,38 +796,43 @@ class VoiceInput:
         ))
 
         # Start keyboard listener for PTT
-        self.listener = pynput.keyboard.Listener(
+        self.listener = self._start_listener()
+
+    def _start_listener(self):
+        """Start a native listener for the hotkey, falling back to pynput"""
+        hotkey = _normalize_hotkey(self.config.push_to_talk_key)
+        for listener_cls in (QuartzHotkeyListener, EvdevHotkeyListener):
+            listener = listener_cls.create(hotkey, self._on_hotkey_press, self._on_hotkey_release)
+            if listener is None:
+                continue
+            try:
+                listener.start()
+                return listener
+            except Exception:
+                continue
+
+        listener = pynput.keyboard.Listener(
             on_press=self._on_key_press,
             on_release=self._on_key_release
         )
-        self.listener.start()
+        listener.start()
+        return listener
         
+    @staticmethod
+    def _build_variants(hotkey: str) -> frozenset:
+        """Names the hotkey may be reported as (e.g. "right_shift" and "shift_r")"""
+        return frozenset({hotkey, _normalize_hotkey(hotkey)})
+
     def _matches_hotkey(self, key):
         """Check if key matches the configured hotkey"""
-        hotkey = self.config.push_to_talk_key.lower()
-
         # Handle simple key names
-        if hasattr(key, 'char') and key.char:
-            return key.char.lower() == hotkey
+        char = getattr(key, 'char', None)
+        if char:
+            return char.lower() in self._hotkey_variants
 
         # Handle special keys
-        if hasattr(key, 'name'):
-            key_name = key.name.lower()
-            # Direct match
-            if key_name == hotkey:
-                return True
-            # Handle different naming conventions (e.g., "right_shift" vs "shift_r")
-            # Normalize: "right_shift" -> "shift_r", "left_ctrl" -> "ctrl_l"
-            hotkey_parts = hotkey.replace('_', ' ').split()
-            if len(hotkey_parts) == 2:
-                # Try reversed format: "right_shift" -> "shift_r"
-                if hotkey_parts[0] in ('right', 'left'):
-                    suffix = 'r' if hotkey_parts[0] == 'right' else 'l'
-                    normalized = f"{hotkey_parts[1]}_{suffix}"
-                    if key_name == normalized:
-                        return True
-
-        return False
+        name = getattr(key, 'name', None)
+        return name is not None and name.lower() in self._hotkey_variants
     
     def _get_ancestors(self) -> list:
         """Get list of ancestor PIDs (cached)"""
@@ -376,34 +896,66 @@ class VoiceInput:
 
     def _on_key_press(self, key):
         """Handle key press events"""
-        if not self.active or self.recording:
-            return
-
         if self._matches_hotkey(key):
-            if not self._is_host_terminal_focused():
-                return
-            self.recording = True
-            threading.Thread(target=self._record_and_transcribe, daemon=True).start()
+            self._on_hotkey_press()
 
     def _on_key_release(self, key):
         """Handle key release events"""
         if self._matches_hotkey(key):
-            self.recording = False
-            # Signal the recorder to stop
-            if hasattr(self.recorder, 'should_continue_recording'):
-                self.recorder.should_continue_recording = False
+            self._on_hotkey_release()
+
+    def _on_hotkey_press(self):
+        """Start recording when the PTT key goes down"""
+        if not self.active or self.recording:
+            return
+
+        if not self._is_host_terminal_focused():
+            return
+        # Still finishing the previous recording (e.g. a quick release and press)
+        if not self._busy.acquire(blocking=False):
+            return
+        self.recording = True
+        threading.Thread(target=self._run_recording, daemon=True).start()
+
+    def _on_hotkey_release(self):
+        """Stop recording when the PTT key comes up"""
+        self.recording = False
+        # Signal the recorder to stop
+        if hasattr(self.recorder, 'should_continue_recording'):
+            self.recorder.should_continue_recording = False
     
+    def _run_recording(self):
+        """Record and transcribe, then allow the next recording to start"""
+        try:
+            self._record_and_transcribe()
+        finally:
+            self._busy.release()
+
     def _record_and_transcribe(self):
         """Record audio and transcribe in a separate thread"""
         # Set up recording control
         self.recorder.should_continue_recording = True
 
+        # Transcribe while recording so only the tail is left after release
+        stream = None
+        if self.config.streaming:
+            stream = StreamingTranscription(self.transcriber, on_confirmed=self.on_partial)
+
         # Record audio
-        audio_data = self.recorder.record_audio()
+        audio_data = self.recorder.record_audio(on_chunk=stream.feed if stream else None)
+
+        # Don't run Whisper on an accidental tap or pure silence
+        if not audio_data or self.recorder.is_silent(audio_data):
+            if stream:
+                stream.cancel()
+            if audio_data:
+                sys.stdout.write("\033[A\033[2K\r🔇 No speech detected\n")
+                sys.stdout.flush()
+            return
 
         if audio_data:
             # Transcribe
-            text = self.transcriber.transcribe(audio_data)
+            text = self.transcriber.transcribe(audio_data, stream=stream)
 
             if text:
                 # Overwrite status line with result
@@ -480,15 +1032,19 @@ def configure_voice():
         sys.exit(1)
     
     # Configure Whisper model size
-    console.print("\nWhisper Model Size (tiny/base/small/medium/large):")
+    console.print(f"\nWhisper Model (current: {config.whisper_model}):")
+    console.print("- distil-small.en: Fast, English only (recommended for English)")
     console.print("- tiny: Fastest, lowest accuracy")
-    console.print("- base: Good balance (recommended)")
+    console.print("- base: Good balance (recommended for other languages)")
     console.print("- small: Better accuracy")
     console.print("- medium: High accuracy")
     console.print("- large: Best accuracy")
     try:
-        model_input = input("Model: ").strip() or "base"
+        model_input = input("Model: ").strip() or config.whisper_model
         config.whisper_model = model_input
+        if model_input.endswith(".en") and config.language != "en":
+            console.print(f"[yellow]{model_input} only transcribes English; "
+                          f"pick a multilingual model for '{config.language}'[/yellow]")
         
         # Configure silence duration
         console.print(f"\nSilence Duration (current: {config.silence_duration}s):")